@@ -2,17 +2,24 @@
 """An XBlock with a tabular problem type that requires students to fill in some cells."""
 from __future__ import absolute_import, division, unicode_literals
 
+import hashlib
+import json
 import textwrap
 
+from webob import Response
 from xblock.core import XBlock
+from xblock.exceptions import JsonHandlerError
 from xblock.fields import Dict, Float, Integer, Scope, String
 from xblock.fragment import Fragment
 from xblock.validation import ValidationMessage
 from xblockutils.resources import ResourceLoader
 from xblockutils.studio_editable import StudioEditableXBlockMixin
 
-from .cells import NumericCell
-from .parsers import ParseError, parse_table, parse_number_list
+# The table parsers and cell classes (and with them ast, decimal and the unit grammar) and the
+# memory profiling code (and with it tracemalloc) are only needed when a block is actually rendered,
+# checked or edited, so they are imported inside the methods using them.  This keeps importing this
+# module cheap for workers that never touch an ActiveTable block.  See
+# tests/unit/test_import_time.py.
 
 loader = ResourceLoader(__name__)  # pylint: disable=invalid-name
 
@@ -127,6 +134,7 @@ class ActiveTableXBlock(StudioEditableXBlockMixin, XBlock):
 
     def parse_fields(self):
         """Parse the user-provided fields into more processing-friendly structured data."""
+        from .parsers import parse_table, parse_number_list
         if self.content:
             self.thead, self.tbody = parse_table(self.content)
         else:
@@ -146,6 +154,7 @@ class ActiveTableXBlock(StudioEditableXBlockMixin, XBlock):
 
         The additional information is taken from other content and student state fields.
         """
+        from .cells import NumericCell
         self.response_cells = {}
         for row, height in zip(self.tbody, self._row_heights[1:]):
             row['height'] = height
@@ -176,34 +185,84 @@ class ActiveTableXBlock(StudioEditableXBlockMixin, XBlock):
             max_attempts=self.max_attempts,
         )
 
+    def get_status_tag(self):
+        """A tag identifying the current version of the status dictionary.
+
+        The tag is derived from the stored student state and settings only, so computing it doesn't
+        require parsing the table definition.
+        """
+        state = [self.answers, self.answers_correct, self.maximum_score, self.max_attempts]
+        state_hash = hashlib.sha1(json.dumps(state, sort_keys=True).encode('utf-8')).hexdigest()
+        return '{}-{}-{}'.format(self.attempts, self.score, state_hash)
+
     def student_view(self, context=None):
         """Render the table."""
-        self.parse_fields()
-        self.postprocess_table()
-
-        context = dict(
-            help_text=self.help_text,
-            total_width=sum(self._column_widths) if self._column_widths else None,
-            column_widths=self._column_widths,
-            head_height=self._row_heights[0] if self._row_heights else None,
-            thead=self.thead,
-            tbody=self.tbody,
-            max_attempts=self.max_attempts,
-        )
-        html = loader.render_template('templates/html/activetable.html', context)
+        frag, profile = self.profiled_student_view()
+        profile.log()
+        return frag
 
-        css_context = dict(
-            correct_icon=self.runtime.local_resource_url(self, 'public/img/correct-icon.png'),
-            incorrect_icon=self.runtime.local_resource_url(self, 'public/img/incorrect-icon.png'),
-            unanswered_icon=self.runtime.local_resource_url(self, 'public/img/unanswered-icon.png'),
-        )
-        css = loader.render_template('templates/css/activetable.css', css_context)
+    def profiled_student_view(self):
+        """Render the table and return a tuple (fragment, memory profile)."""
+        from .profiling import MemoryProfile
+        profile = MemoryProfile('student_view')
+        with profile.phase('parse'):
+            self.parse_fields()
+        with profile.phase('postprocess'):
+            self.postprocess_table()
 
-        frag = Fragment(html)
-        frag.add_css(css)
-        frag.add_javascript(loader.load_unicode('static/js/src/activetable.js'))
-        frag.initialize_js('ActiveTableXBlock', self.get_status())
-        return frag
+        with profile.phase('render'):
+            context = dict(
+                help_text=self.help_text,
+                total_width=sum(self._column_widths) if self._column_widths else None,
+                column_widths=self._column_widths,
+                head_height=self._row_heights[0] if self._row_heights else None,
+                thead=self.thead,
+                tbody=self.tbody,
+                max_attempts=self.max_attempts,
+            )
+            html = loader.render_template('templates/html/activetable.html', context)
+
+            css_context = dict(
+                correct_icon=self.runtime.local_resource_url(self, 'public/img/correct-icon.png'),
+                incorrect_icon=self.runtime.local_resource_url(
+                    self, 'public/img/incorrect-icon.png'
+                ),
+                unanswered_icon=self.runtime.local_resource_url(
+                    self, 'public/img/unanswered-icon.png'
+                ),
+            )
+            css = loader.render_template('templates/css/activetable.css', css_context)
+
+            frag = Fragment(html)
+            frag.add_css(css)
+            frag.add_javascript(loader.load_unicode('static/js/src/activetable.js'))
+            frag.initialize_js('ActiveTableXBlock', self.get_status())
+        return frag, profile
+
+    def grade_answers(self, data):
+        """Check the given answers without storing them.
+
+        Returns a dictionary mapping cell ids to Boolean values indicating whether the answer is
+        correct.
+        """
+        answers_correct, profile = self.profiled_grade_answers(data)
+        profile.log()
+        return answers_correct
+
+    def profiled_grade_answers(self, data):
+        """Check the given answers and return a tuple (answers_correct, memory profile)."""
+        from .profiling import MemoryProfile
+        profile = MemoryProfile('grade_answers')
+        with profile.phase('parse'):
+            self.parse_fields()
+        with profile.phase('postprocess'):
+            self.postprocess_table()
+        with profile.phase('grade'):
+            answers_correct = {
+                cell_id: self.response_cells[cell_id].check_response(value)
+                for cell_id, value in data.iteritems()
+            }
+        return answers_correct, profile
 
     def check_and_save_answers(self, data):
         """Common implementation for the check and save handlers."""
@@ -212,12 +271,7 @@ class ActiveTableXBlock(StudioEditableXBlockMixin, XBlock):
             # we can only get here by manually crafted requests.  We simply return the current
             # status without rechecking or storing the answers in that case.
             return self.get_status()
-        self.parse_fields()
-        self.postprocess_table()
-        answers_correct = {
-            cell_id: self.response_cells[cell_id].check_response(value)
-            for cell_id, value in data.iteritems()
-        }
+        answers_correct = self.grade_answers(data)
         # Since the previous statement executed without error, the data is well-formed enough to be
         # stored.  We now know it's a dictionary and all the keys are valid cell ids.
         self.answers = data
@@ -242,12 +296,60 @@ class ActiveTableXBlock(StudioEditableXBlockMixin, XBlock):
         self.answers_correct = None
         return self.get_status()
 
+    @XBlock.handler
+    def status(self, request, unused_suffix=''):
+        """Return the status dictionary as JSON, tagged with an ETag.
+
+        This read-only handler is meant for clients polling the status of the block.  If the
+        client's If-None-Match header matches the current tag, an empty "304 Not Modified" response
+        is returned.  Responses are marked private, so shared caches don't serve them to other
+        learners.
+        """
+        tag = self.get_status_tag()
+        if tag in request.if_none_match:
+            response = Response(status=304)
+        else:
+            response = Response(
+                json.dumps(self.get_status()), content_type='application/json', charset='utf8'
+            )
+        response.etag = tag
+        # The status is specific to the learner, but handler URLs are not, so shared caches must
+        # not store it, and clients must revalidate it on every poll.
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+        return response
+
+    @XBlock.json_handler
+    def memory_profile(self, data, unused_suffix=''):
+        """Profile the memory used for rendering the table and grading answers.
+
+        The answers in the request are graded, or the stored answers if the request contains none.
+        Nothing is stored.  This debug handler is only available if memory profiling is enabled,
+        see activetable.profiling.
+        """
+        from .profiling import is_enabled
+        if not is_enabled():
+            raise JsonHandlerError(404, 'Memory profiling is not enabled.')
+        _, render_profile = self.profiled_student_view()
+        answers = data or self.answers
+        if not isinstance(answers, dict):
+            raise JsonHandlerError(400, 'The answers must be a dictionary.')
+        unknown_cell_ids = set(answers) - set(self.response_cells)
+        if unknown_cell_ids:
+            raise JsonHandlerError(
+                400, 'Unknown cell ids: {}'.format(', '.join(sorted(unknown_cell_ids)))
+            )
+        _, grade_profile = self.profiled_grade_answers(answers)
+        return [render_profile.as_dict(), grade_profile.as_dict()]
+
     def validate_field_data(self, validation, data):
         """Validate the data entered by the user.
 
         This handler is called when the "Save" button is clicked in Studio after editing the
         properties of this XBlock.
         """
+        from .parsers import ParseError, parse_table, parse_number_list
+
         def add_error(msg):
             """Add a validation error."""
             validation.add(ValidationMessage(ValidationMessage.ERROR, msg))
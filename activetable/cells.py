@@ -8,6 +8,14 @@ classes themselves.
 from __future__ import absolute_import, division, unicode_literals
 
 import decimal
+import re
+
+from .units import UnitError, parse_unit
+
+# Splits a response like '9.81 m/s^2' into the number and the unit.
+_VALUE_WITH_UNIT_RE = re.compile(
+    r'^\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*(.*?)\s*$', re.UNICODE
+)
 
 
 class Cell(object):
@@ -35,25 +43,57 @@ class NumericCell(Cell):
     placeholder = 'numeric response'
 
     def __init__(self, answer, tolerance=None,
-                 min_significant_digits=None, max_significant_digits=None):
-        """Set the correct answer and the allowed relative tolerance in percent."""
+                 min_significant_digits=None, max_significant_digits=None, unit=None):
+        """Set the correct answer and the allowed relative tolerance in percent.
+
+        If a unit is given, the answer is expressed in that unit, and responses may be given in any
+        unit of the same dimension.  The conversion factor of the answer unit is computed once here.
+        """
         self.answer = answer
         self.abs_tolerance = None
         self.set_tolerance(tolerance)
         self.min_significant_digits = min_significant_digits
         self.max_significant_digits = max_significant_digits
+        self.unit = unit
+        if unit is not None:
+            self.unit_factor, self.unit_dimensions = parse_unit(unit)
 
     def set_tolerance(self, tolerance):
         """Set the tolerance to the specified value, if it is not None."""
         if tolerance is not None:
             self.abs_tolerance = abs(self.answer) * tolerance / 100.0
 
+    def _parse_response(self, student_response):
+        """Split the response into the numeric part and its value in the unit of the answer.
+
+        Responses without a unit are taken to be in the unit of the answer.  Returns None if the
+        response can't be parsed or has the wrong dimension.
+        """
+        if self.unit is None:
+            return student_response, float(student_response)
+        match = _VALUE_WITH_UNIT_RE.match(student_response)
+        if not match:
+            return None
+        number, unit = match.groups()
+        if not unit:
+            return number, float(number)
+        try:
+            factor, dimensions = parse_unit(unit)
+        except UnitError:
+            return None
+        if dimensions != self.unit_dimensions:
+            return None
+        return number, float(number) * factor / self.unit_factor
+
     def check_response(self, student_response):
         """Return a Boolean value indicating whether the student response is correct."""
         try:
-            value = float(student_response)
+            parsed = self._parse_response(student_response)
         except ValueError:
             return False
+        if parsed is None:
+            return False
+        student_response, value = parsed
         if self.min_significant_digits or self.max_significant_digits:
             digits = len(decimal.Decimal(student_response).as_tuple().digits)
             if self.min_significant_digits and digits < self.min_significant_digits:
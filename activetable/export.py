@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""Static export of ActiveTable blocks for offline course packages and CDN-cached previews.
+
+All <activetable> elements found in the XML files of an OLX course export are rendered to static
+HTML pages with their student view.  Blocks with identical definitions are rendered only once, and
+CSS and JavaScript resources are written to content-addressed files shared by all pages.  Blocks
+are rendered in parallel in a process pool.
+
+Usage:
+
+    python -m activetable.export [--jquery-url <url>] <olx directory> <output directory>
+
+The pages load jQuery from --jquery-url (by default from a CDN; point it to a local copy for offline
+packages) and initialize the frontend code of each block with a stub runtime.  Since there is no LMS
+to handle requests, the Check and Save buttons are hidden.
+
+The output directory contains:
+
+    manifest.json             maps the url_name of each block to its page and initialization data
+    blocks/<hash>.html        one page per distinct block definition
+    assets/<hash>.css|.js     the shared CSS and JavaScript resources
+    assets/public/...         the images referenced by the CSS
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import shutil
+import sys
+import traceback
+from multiprocessing import Pool
+from xml.etree import ElementTree
+
+from xblock.field_data import DictFieldData
+from xblock.fields import ScopeIds
+from xblock.runtime import Runtime
+
+from .activetable import ActiveTableXBlock
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+RESOURCE_EXTENSIONS = {
+    'text/css': 'css',
+    'application/javascript': 'js',
+}
+
+DEFAULT_JQUERY_URL = 'https://code.jquery.com/jquery-2.2.4.min.js'
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+{head}
+<style>.activetable_block .action button {{ display: none; }}</style>
+</head>
+<body>
+<div class="xblock" data-block-type="activetable" data-init="{init_fn}">
+{content}
+</div>
+<script src="{jquery_url}"></script>
+{foot}
+<script>
+(function() {{
+    var runtime = {{handlerUrl: function() {{ return '#'; }}}};
+    var element = document.querySelector('.xblock[data-block-type="activetable"]');
+    window[{init_fn_json}](runtime, element, {init_args_json});
+}})();
+</script>
+</body>
+</html>
+"""
+
+
+class StaticExportRuntime(Runtime):
+    """A runtime that renders blocks without an LMS, with resource URLs relative to the assets."""
+
+    def __init__(self):
+        super(StaticExportRuntime, self).__init__(id_reader=None)
+
+    def handler_url(self, block, handler_name, suffix='', query='', thirdparty=False):
+        # Handlers are not available in static exports.
+        return '#'
+
+    def resource_url(self, resource):
+        return resource
+
+    def local_resource_url(self, block, uri):
+        # The stylesheets referencing these URLs are stored in the assets directory.
+        return uri
+
+    def publish(self, block, event_type, event_data):
+        pass
+
+
+def configure_django():
+    """Configure minimal Django settings for rendering the templates, unless already configured.
+
+    The templates are rendered by xblockutils with Django, which needs configured settings.  Inside
+    the LMS or the workbench, these come from DJANGO_SETTINGS_MODULE.
+    """
+    import django
+    from django.conf import settings
+    if not settings.configured and not os.environ.get('DJANGO_SETTINGS_MODULE'):
+        settings.configure(TEMPLATES=[
+            {'BACKEND': 'django.template.backends.django.DjangoTemplates', 'APP_DIRS': False},
+        ])
+    django.setup()
+
+
+def find_definitions(olx_dir):
+    """Find all ActiveTable definitions in the XML files below olx_dir.
+
+    Returns a list of (url_name, attributes, content) tuples.  Elements that only reference a
+    definition stored in a separate file (i.e. that only have a url_name) are skipped.
+    """
+    definitions = []
+    for dirname, _, files in sorted(os.walk(olx_dir)):
+        for fname in sorted(files):
+            if not fname.endswith('.xml'):
+                continue
+            path = os.path.join(dirname, fname)
+            root = ElementTree.parse(path).getroot()
+            for index, node in enumerate(root.iter('activetable')):
+                attributes = dict(node.items())
+                content = (node.text or '').strip()
+                url_name = attributes.pop('url_name', None)
+                if not attributes and not content:
+                    continue
+                if url_name is None:
+                    if node is root:
+                        url_name = os.path.splitext(fname)[0]
+                    else:
+                        url_name = '{}_{}'.format(os.path.relpath(path, olx_dir), index)
+                definitions.append((url_name, attributes, content))
+    return definitions
+
+
+def definition_hash(attributes, content):
+    """Return a hash identifying the given definition."""
+    data = json.dumps([attributes, content], sort_keys=True)
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+
+def render_definition(definition):
+    """Render the student view of a single definition.
+
+    Returns a tuple (content, resources, init_fn, init_args), where resources is a list of
+    (mimetype, data) tuples.  This is a module-level function so it can be used with a process pool.
+    """
+    attributes, content = definition
+    block = ActiveTableXBlock(
+        StaticExportRuntime(), DictFieldData({}), ScopeIds(None, 'activetable', None, None)
+    )
+    for name, value in attributes.items():
+        if name in block.fields:
+            setattr(block, name, block.fields[name].from_string(value))
+    if content:
+        block.content = content
+    frag = block.student_view()
+    resources = [
+        (resource.mimetype, resource.data) for resource in frag.resources
+        if resource.kind == 'text' and resource.mimetype in RESOURCE_EXTENSIONS
+    ]
+    return frag.content, resources, frag.js_init_fn, frag.json_init_args
+
+
+def render_definition_safely(definition):
+    """Render a definition and return a tuple (result, error).
+
+    On success, result is the return value of render_definition() and error is None.  On failure,
+    result is None and error describes the exception.  Exceptions are not propagated, so a single
+    broken definition doesn't abort the whole export.
+    """
+    try:
+        return render_definition(definition), None
+    except Exception as exc:  # pylint: disable=broad-except
+        return None, traceback.format_exception_only(type(exc), exc)[-1].strip()
+
+
+def write_file(path, data):
+    """Write the string data to path in UTF-8, creating the parent directory if necessary."""
+    dirname = os.path.dirname(path)
+    if not os.path.isdir(dirname):
+        os.makedirs(dirname)
+    with io.open(path, 'wb') as out:
+        out.write(data.encode('utf-8'))
+
+
+def write_asset(output_dir, mimetype, data, written_assets):
+    """Write a CSS or JavaScript resource once and return its path relative to output_dir."""
+    digest = hashlib.sha1(data.encode('utf-8')).hexdigest()
+    relpath = 'assets/{}.{}'.format(digest, RESOURCE_EXTENSIONS[mimetype])
+    if relpath not in written_assets:
+        write_file(os.path.join(output_dir, relpath), data)
+        written_assets.add(relpath)
+    return relpath
+
+
+def script_json(value):
+    """Serialize value as JSON that can be embedded in an inline <script> element."""
+    return json.dumps(value, sort_keys=True).replace('</', '<\\/')
+
+
+def export(olx_dir, output_dir, processes=None, jquery_url=DEFAULT_JQUERY_URL):
+    """Render all ActiveTable blocks found in olx_dir to static files in output_dir.
+
+    Files from previous exports to the same directory are removed.  Returns a tuple (manifest,
+    errors).  The manifest is also written to output_dir/manifest.json.  Blocks that could not be
+    rendered are left out of the manifest; errors maps their url_names to the error messages.
+    """
+    definitions = find_definitions(olx_dir)
+    unique = {}
+    for _, attributes, content in definitions:
+        unique.setdefault(definition_hash(attributes, content), (attributes, content))
+    hashes = sorted(unique)
+    pool = Pool(processes)
+    try:
+        rendered = pool.map(render_definition_safely, [unique[digest] for digest in hashes])
+    finally:
+        pool.close()
+        pool.join()
+
+    for dirname in ['assets', 'blocks']:
+        shutil.rmtree(os.path.join(output_dir, dirname), ignore_errors=True)
+    shutil.copytree(os.path.join(PACKAGE_DIR, 'public'),
+                    os.path.join(output_dir, 'assets', 'public'))
+    written_assets = set()
+    pages = {}
+    render_errors = {}
+    for digest, (result, error) in zip(hashes, rendered):
+        if error is not None:
+            render_errors[digest] = error
+            continue
+        content, resources, init_fn, init_args = result
+        head, foot = [], []
+        for mimetype, data in resources:
+            url = '../' + write_asset(output_dir, mimetype, data, written_assets)
+            if mimetype == 'text/css':
+                head.append('<link rel="stylesheet" href="{}">'.format(url))
+            else:
+                foot.append('<script src="{}"></script>'.format(url))
+        page = 'blocks/{}.html'.format(digest)
+        write_file(os.path.join(output_dir, page), PAGE_TEMPLATE.format(
+            head='\n'.join(head), foot='\n'.join(foot), init_fn=init_fn, content=content,
+            jquery_url=jquery_url, init_fn_json=script_json(init_fn),
+            init_args_json=script_json(init_args),
+        ))
+        pages[digest] = dict(page=page, init_fn=init_fn, init_args=init_args)
+
+    manifest = {}
+    errors = {}
+    for url_name, attributes, content in definitions:
+        digest = definition_hash(attributes, content)
+        if digest in pages:
+            manifest[url_name] = pages[digest]
+        else:
+            errors[url_name] = render_errors[digest]
+    write_file(os.path.join(output_dir, 'manifest.json'),
+               json.dumps(manifest, indent=2, sort_keys=True))
+    return manifest, errors
+
+
+def main():
+    """Parse the command line arguments and run the export."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('olx_dir', help='directory containing the OLX course export')
+    parser.add_argument('output_dir', help='directory the static files are written to')
+    parser.add_argument('--processes', type=int, default=None,
+                        help='number of worker processes (default: number of CPUs)')
+    parser.add_argument('--jquery-url', default=DEFAULT_JQUERY_URL,
+                        help='URL of jQuery used by the pages (default: %(default)s)')
+    args = parser.parse_args()
+    configure_django()
+    manifest, errors = export(args.olx_dir, args.output_dir, args.processes, args.jquery_url)
+    print('Exported {} blocks as {} pages.'.format(
+        len(manifest), len({entry['page'] for entry in manifest.values()})
+    ))
+    if errors:
+        print('Failed to export {} blocks:'.format(len(errors)), file=sys.stderr)
+        for url_name in sorted(errors):
+            print('    {}: {}'.format(url_name, errors[url_name]), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -19,6 +19,17 @@ def _ensure_type(node, expected_type):
     raise ParseError('the structure of the table definition is invalid')
 
 
+def _unicode_value(node):
+    """Internal helper returning the value of a string literal node as a unicode string.
+
+    On Python 2, string literals are parsed as UTF-8 encoded byte strings.
+    """
+    value = _ensure_type(node, ast.Str).s
+    if isinstance(value, bytes):
+        value = value.decode('utf-8')
+    return value
+
+
 def parse_table(table_definition):
     """Parse the table definition given by the user.
 
@@ -64,7 +75,8 @@ def _parse_response_cell(cell_node):
     """Parse a single student response cell definition.
 
     Response cells are written in function call syntax, either Text(...) or Numeric(...).  All
-    arguments must be keyword arguments.
+    arguments must be keyword arguments.  All arguments to Numeric(...) are numbers, except for the
+    unit, which is a string.
     """
     cell_type = _ensure_type(cell_node.func, ast.Name).id
     if any((cell_node.args, cell_node.starargs, cell_node.kwargs)):
@@ -76,7 +88,11 @@ def _parse_response_cell(cell_node):
         kwargs = {kw.arg: _ensure_type(kw.value, ast.Str).s for kw in cell_node.keywords}
     elif cell_type == 'Numeric':
         cell_class = NumericCell
-        kwargs = {kw.arg: _ensure_type(kw.value, ast.Num).n for kw in cell_node.keywords}
+        kwargs = {
+            kw.arg: _unicode_value(kw.value) if kw.arg == 'unit'
+            else _ensure_type(kw.value, ast.Num).n
+            for kw in cell_node.keywords
+        }
     else:
         raise ParseError('invalid cell input type: {}'.format(cell_type))
     try:
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""Opt-in memory profiling of the processing phases of a request.
+
+Profiling is enabled by setting the environment variable ACTIVETABLE_PROFILE_MEMORY to a non-empty
+value and requires the tracemalloc module.  For each phase, the peak memory and the top allocation
+sites are recorded and logged.  When profiling is disabled, MemoryProfile.phase() does nothing.
+
+Tracing is started once, when the first phase is profiled, and is never stopped, since tracemalloc
+is process-wide and other threads may be profiling at the same time.  The peak memory can only be
+attributed to a phase if no other phase ran concurrently and tracemalloc.reset_peak() is available
+(Python 3.9+); otherwise it is recorded as None.  The allocation sites of concurrent phases may
+include allocations from other threads.  Errors in the profiling code are logged and never affect
+the request.
+"""
+from __future__ import absolute_import, division, unicode_literals
+
+import contextlib
+import json
+import logging
+import os
+import threading
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None  # pylint: disable=invalid-name
+
+log = logging.getLogger(__name__)  # pylint: disable=invalid-name
+
+ENABLED = bool(os.environ.get('ACTIVETABLE_PROFILE_MEMORY')) and tracemalloc is not None
+
+# Number of frames stored per allocation traceback.
+TRACEBACK_FRAMES = 1
+# Number of allocation sites recorded per phase.
+TOP_ALLOCATION_SITES = 10
+
+# Protects the bookkeeping of concurrently running phases.
+_lock = threading.Lock()  # pylint: disable=invalid-name
+# The number of phases currently running, and the number of phases started so far.
+_phase_counts = dict(active=0, started=0)  # pylint: disable=invalid-name
+
+
+def is_enabled():
+    """Return whether memory profiling is enabled."""
+    return ENABLED
+
+
+class MemoryProfile(object):
+    """Memory usage of the phases of a single request, e.g. parse, postprocess, render and grade."""
+
+    def __init__(self, label):
+        self.label = label
+        self.phases = []
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Context manager recording the memory allocated while the body is executed."""
+        if not is_enabled():
+            yield
+            return
+        try:
+            state = self._start_phase()
+        except Exception:  # pylint: disable=broad-except
+            log.exception('Memory profiling of phase %s failed.', name)
+            state = None
+        try:
+            yield
+        finally:
+            if state is not None:
+                try:
+                    self._finish_phase(name, state)
+                except Exception:  # pylint: disable=broad-except
+                    log.exception('Memory profiling of phase %s failed.', name)
+
+    @staticmethod
+    def _start_phase():
+        """Start tracing if necessary and return the state needed by _finish_phase()."""
+        with _lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(TRACEBACK_FRAMES)
+        before = tracemalloc.take_snapshot()
+        with _lock:
+            exclusive = _phase_counts['active'] == 0
+            _phase_counts['active'] += 1
+            _phase_counts['started'] += 1
+            started = _phase_counts['started']
+            if exclusive and hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        return dict(exclusive=exclusive, started=started, baseline=baseline, before=before)
+
+    def _finish_phase(self, name, state):
+        """Record the memory usage of the phase started with the given state."""
+        with _lock:
+            _phase_counts['active'] -= 1
+            exclusive = state['exclusive'] and _phase_counts['started'] == state['started']
+            current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        if exclusive and hasattr(tracemalloc, 'reset_peak'):
+            peak = max(peak - state['baseline'], 0)
+        else:
+            peak = None
+        self.phases.append(dict(
+            name=name,
+            peak=peak,
+            allocated=current - state['baseline'],
+            concurrent=not exclusive,
+            top=self._top_allocation_sites(state['before'], after),
+        ))
+
+    @staticmethod
+    def _top_allocation_sites(before, after):
+        """Return the allocation sites with the largest growth between the two snapshots."""
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        stats = after.filter_traces(filters).compare_to(before.filter_traces(filters), 'lineno')
+        return [
+            dict(site=str(stat.traceback), size=stat.size_diff, count=stat.count_diff)
+            for stat in stats[:TOP_ALLOCATION_SITES]
+        ]
+
+    def as_dict(self):
+        """Return the recorded data as a JSON-serializable dictionary."""
+        return dict(label=self.label, phases=self.phases)
+
+    def log(self):
+        """Log the recorded data, if any."""
+        if self.phases:
+            log.info('Memory profile: %s', json.dumps(self.as_dict()))
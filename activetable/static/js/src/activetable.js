@@ -4,21 +4,46 @@ function ActiveTableXBlock(runtime, element, init_args) {
     var checkHandlerUrl = runtime.handlerUrl(element, 'check_answers');
     var saveHandlerUrl = runtime.handlerUrl(element, 'save_answers');
 
+    // Index of the response cells by cell id, built once so status updates don't need to query
+    // the DOM.  Each entry also remembers the classes the cell was rendered with and the state
+    // class currently applied to it, so the class attribute can be written without reading it.
+    var responseCells = {};
+    var cellIds = [];
+    $('td.active', element).each(function() {
+        responseCells[this.id] = {
+            cell: this, input: $('input', this)[0], baseClasses: this.className, state: null
+        };
+        cellIds.push(this.id);
+    });
+
     function markResponseCells(data) {
-        if (data.answers_correct) {
-            $.each(data.answers_correct, function(cell_id, correct) {
-                var $cell = $('#' + cell_id, element);
-                $cell.removeClass('right-answer wrong-answer unchecked');
-                if (correct) {
-                    $cell.addClass('right-answer');
-                    $cell.prop('title', 'correct');
-                } else {
-                    $cell.addClass('wrong-answer');
-                    $cell.prop('title', 'incorrect');
-                }
-            });
-        } else {
-            $('td.active', element).removeClass('right-answer wrong-answer').addClass('unchecked');
+        var changes = [], i, cell_id, entry, state;
+        // First determine which cells change their state, then write all changes to the DOM in a
+        // single pass.
+        for (i = 0; i < cellIds.length; i++) {
+            cell_id = cellIds[i];
+            entry = responseCells[cell_id];
+            if (!data.answers_correct) {
+                state = 'unchecked';
+            } else if (data.answers_correct.hasOwnProperty(cell_id)) {
+                state = data.answers_correct[cell_id] ? 'right-answer' : 'wrong-answer';
+            } else {
+                continue;
+            }
+            if (state !== entry.state) {
+                changes.push({entry: entry, state: state});
+            }
+        }
+        for (i = 0; i < changes.length; i++) {
+            entry = changes[i].entry;
+            state = changes[i].state;
+            entry.cell.className = entry.baseClasses + ' ' + state;
+            if (state === 'right-answer') {
+                entry.cell.title = 'correct';
+            } else if (state === 'wrong-answer') {
+                entry.cell.title = 'incorrect';
+            }
+            entry.state = state;
         }
     }
 
@@ -72,9 +97,9 @@ function ActiveTableXBlock(runtime, element, init_args) {
 
     function callHandler(url) {
         var answers = {};
-        $('td.active', element).each(function() {
-            answers[this.id] = $('input', this).val();
-        });
+        for (var i = 0; i < cellIds.length; i++) {
+            answers[cellIds[i]] = responseCells[cellIds[i]].input.value;
+        }
         $.ajax({
             type: "POST",
             url: url,
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""A small grammar for physical units used by numeric response cells.
+
+Unit expressions are products and quotients of unit symbols with optional integer exponents, e.g.
+'m/s^2', 'kg*m^2/s^2', 'J/(mol*K)' or 'km h^-1'.  Unit symbols may carry an SI prefix.  Each unit
+expression is reduced to a conversion factor to SI base units and a tuple of exponents of the SI
+base dimensions.  Recently parsed units are memoized, so repeated parsing of the same unit string is
+a dict lookup.
+"""
+from __future__ import absolute_import, division, unicode_literals
+
+import re
+import threading
+from collections import OrderedDict
+
+
+class UnitError(ValueError):
+    """A unit expression could not be parsed."""
+
+
+# Exponents of the SI base dimensions in the order (m, kg, s, A, K, mol, cd).
+_DIMENSIONLESS = (0, 0, 0, 0, 0, 0, 0)
+
+
+def _dim(m=0, kg=0, s=0, A=0, K=0, mol=0, cd=0):  # pylint: disable=invalid-name
+    """Internal helper to spell out dimension tuples."""
+    return (m, kg, s, A, K, mol, cd)
+
+
+# Units that accept SI prefixes, mapped to (factor, dimensions).
+_PREFIXABLE_UNITS = {
+    'm': (1.0, _dim(m=1)),
+    'g': (1e-3, _dim(kg=1)),
+    's': (1.0, _dim(s=1)),
+    'A': (1.0, _dim(A=1)),
+    'K': (1.0, _dim(K=1)),
+    'mol': (1.0, _dim(mol=1)),
+    'cd': (1.0, _dim(cd=1)),
+    'N': (1.0, _dim(m=1, kg=1, s=-2)),
+    'J': (1.0, _dim(m=2, kg=1, s=-2)),
+    'W': (1.0, _dim(m=2, kg=1, s=-3)),
+    'Pa': (1.0, _dim(m=-1, kg=1, s=-2)),
+    'Hz': (1.0, _dim(s=-1)),
+    'C': (1.0, _dim(s=1, A=1)),
+    'V': (1.0, _dim(m=2, kg=1, s=-3, A=-1)),
+    'ohm': (1.0, _dim(m=2, kg=1, s=-3, A=-2)),
+    'Ω': (1.0, _dim(m=2, kg=1, s=-3, A=-2)),
+    'F': (1.0, _dim(m=-2, kg=-1, s=4, A=2)),
+    'T': (1.0, _dim(kg=1, s=-2, A=-1)),
+    'L': (1e-3, _dim(m=3)),
+    'eV': (1.602176634e-19, _dim(m=2, kg=1, s=-2)),
+}
+
+# Units that do not accept SI prefixes.
+_PLAIN_UNITS = {
+    'min': (60.0, _dim(s=1)),
+    'h': (3600.0, _dim(s=1)),
+    'd': (86400.0, _dim(s=1)),
+    'bar': (1e5, _dim(m=-1, kg=1, s=-2)),
+    'atm': (101325.0, _dim(m=-1, kg=1, s=-2)),
+    'cal': (4.184, _dim(m=2, kg=1, s=-2)),
+    '%': (0.01, _DIMENSIONLESS),
+}
+
+_PREFIXES = {
+    'Y': 1e24, 'Z': 1e21, 'E': 1e18, 'P': 1e15, 'T': 1e12, 'G': 1e9, 'M': 1e6, 'k': 1e3,
+    'h': 1e2, 'da': 1e1, 'd': 1e-1, 'c': 1e-2, 'm': 1e-3, 'u': 1e-6, 'µ': 1e-6, 'μ': 1e-6,
+    'n': 1e-9, 'p': 1e-12, 'f': 1e-15, 'a': 1e-18, 'z': 1e-21, 'y': 1e-24,
+}
+
+_TOKEN_RE = re.compile(
+    r'\s*(?:(?P<symbol>[^\W\d_]+|%)|(?P<exponent>(?:\^|\*\*)\s*[-+]?\d+)|(?P<op>[*/·()]))',
+    re.UNICODE,
+)
+
+# Limits for unit expressions.  Units are parsed from student responses, so these keep arbitrary
+# input from exhausting the recursion limit or overflowing the conversion factor.
+MAX_UNIT_LENGTH = 100
+MAX_NESTING_DEPTH = 10
+MAX_EXPONENT = 99
+
+# Number of memoized unit expressions.  Only successful parses are memoized, and the least recently
+# used entry is evicted when the cache is full.
+_UNIT_CACHE_SIZE = 1024
+_unit_cache = OrderedDict()  # pylint: disable=invalid-name
+_unit_cache_lock = threading.Lock()  # pylint: disable=invalid-name
+
+
+def _lookup_symbol(symbol):
+    """Return (factor, dimensions) for a single, possibly prefixed unit symbol."""
+    if symbol in _PLAIN_UNITS:
+        return _PLAIN_UNITS[symbol]
+    if symbol in _PREFIXABLE_UNITS:
+        return _PREFIXABLE_UNITS[symbol]
+    for prefix_length in (1, 2):
+        prefix, unit = symbol[:prefix_length], symbol[prefix_length:]
+        if prefix in _PREFIXES and unit in _PREFIXABLE_UNITS:
+            factor, dimensions = _PREFIXABLE_UNITS[unit]
+            return _PREFIXES[prefix] * factor, dimensions
+    raise UnitError('unknown unit: {}'.format(symbol))
+
+
+def _tokenize(unit_string):
+    """Split a unit expression into a list of (kind, text) tokens."""
+    tokens = []
+    pos = 0
+    unit_string = unit_string.rstrip()
+    while pos < len(unit_string):
+        match = _TOKEN_RE.match(unit_string, pos)
+        if not match:
+            raise UnitError('invalid unit expression: {}'.format(unit_string))
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == 'exponent':
+            text = text.lstrip('^*').strip()
+        tokens.append((kind, text))
+        pos = match.end()
+    return tokens
+
+
+class _UnitParser(object):
+    """Recursive descent parser for unit expressions.
+
+    Grammar:
+        expression := term (('*' | '·' | '/' | <juxtaposition>) term)*
+        term       := (symbol | '(' expression ')') exponent?
+    """
+
+    def __init__(self, unit_string):
+        self.unit_string = unit_string
+        self.tokens = _tokenize(unit_string)
+        self.pos = 0
+        self.depth = 0
+
+    def error(self):
+        """Return a UnitError for the expression being parsed."""
+        return UnitError('invalid unit expression: {}'.format(self.unit_string))
+
+    def peek(self):
+        """Return the current token without consuming it."""
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        return None, None
+
+    def advance(self):
+        """Consume and return the current token."""
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def parse(self):
+        """Parse the whole expression and return (factor, dimensions)."""
+        result = self.expression()
+        if self.pos != len(self.tokens):
+            raise self.error()
+        return result
+
+    def expression(self):
+        """Parse a product or quotient of terms."""
+        factor, dimensions = self.term()
+        while True:
+            kind, text = self.peek()
+            if kind == 'op' and text in '*·/':
+                self.advance()
+                sign = -1 if text == '/' else 1
+            elif kind == 'symbol' or (kind, text) == ('op', '('):
+                sign = 1
+            else:
+                return factor, dimensions
+            term_factor, term_dimensions = self.term()
+            try:
+                factor *= term_factor ** sign
+            except (OverflowError, ZeroDivisionError):
+                raise UnitError('unit out of range: {}'.format(self.unit_string))
+            dimensions = tuple(a + sign * b for a, b in zip(dimensions, term_dimensions))
+
+    def term(self):
+        """Parse a unit symbol or a parenthesised expression with an optional exponent."""
+        kind, text = self.advance()
+        if kind == 'symbol':
+            factor, dimensions = _lookup_symbol(text)
+        elif (kind, text) == ('op', '('):
+            self.depth += 1
+            if self.depth > MAX_NESTING_DEPTH:
+                raise UnitError('unit expression is nested too deeply')
+            factor, dimensions = self.expression()
+            if self.advance() != ('op', ')'):
+                raise self.error()
+            self.depth -= 1
+        else:
+            raise self.error()
+        kind, text = self.peek()
+        if kind == 'exponent':
+            self.advance()
+            exponent = int(text)
+            if abs(exponent) > MAX_EXPONENT:
+                raise UnitError('exponent out of range: {}'.format(exponent))
+            try:
+                factor **= exponent
+            except (OverflowError, ZeroDivisionError):
+                raise UnitError('unit out of range: {}'.format(self.unit_string))
+            dimensions = tuple(exponent * d for d in dimensions)
+        return factor, dimensions
+
+
+def parse_unit(unit_string):
+    """Parse a unit expression and return a tuple (factor, dimensions).
+
+    The factor converts values given in this unit to SI base units.  The dimensions are the
+    exponents of the SI base dimensions.  An empty string is treated as dimensionless.  Successful
+    parses are memoized; on error, UnitError is raised.
+    """
+    with _unit_cache_lock:
+        result = _unit_cache.pop(unit_string, None)
+        if result is not None:
+            _unit_cache[unit_string] = result
+            return result
+    if len(unit_string) > MAX_UNIT_LENGTH:
+        raise UnitError('unit expression too long')
+    if unit_string.strip():
+        result = _UnitParser(unit_string).parse()
+    else:
+        result = (1.0, _DIMENSIONLESS)
+    factor = result[0]
+    if not 0.0 < abs(factor) < float('inf'):
+        raise UnitError('unit out of range: {}'.format(unit_string))
+    with _unit_cache_lock:
+        _unit_cache[unit_string] = result
+        if len(_unit_cache) > _UNIT_CACHE_SIZE:
+            _unit_cache.popitem(last=False)
+    return result
@@ -0,0 +1,155 @@
+/* Benchmark for the status updates of activetable.js on large tables, using a jsdom DOM.
+ *
+ * Each scenario is measured for the current code and for a baseline reimplementing the previous
+ * code, which looked up every cell with $('#' + cell_id, element) on each update and collected the
+ * answers by walking all td.active cells with jQuery.  The script exits with a non-zero status if
+ * the current code is slower than the baseline in any scenario.
+ *
+ * Usage:
+ *
+ *     cd tests/js && npm install && npm run benchmark [-- <number of cells> <iterations>]
+ */
+'use strict';
+
+var fs = require('fs');
+var path = require('path');
+var JSDOM = require('jsdom').JSDOM;
+var jquery = require('jquery');
+
+var SOURCE_PATH = path.join(__dirname, '../../activetable/static/js/src/activetable.js');
+var NUM_COLUMNS = 10;
+
+function tableHtml(numCells) {
+    var rows = [], cells, row, col, cellId;
+    for (row = 1; row <= numCells / NUM_COLUMNS; row++) {
+        cells = [];
+        for (col = 0; col < NUM_COLUMNS; col++) {
+            cellId = 'cell_' + row + '_' + col;
+            cells.push(
+                '<td class="active" id="' + cellId + '">' +
+                '<input id="input_' + cellId + '" type="text" value="' + row + '"></td>'
+            );
+        }
+        rows.push('<tr>' + cells.join('') + '</tr>');
+    }
+    return '<div class="activetable_block"><table><tbody>' + rows.join('') + '</tbody></table>' +
+        '<p class="status"></p><div class="status-message"></div>' +
+        '<div class="action"><button class="check"><span class="check-label">Check</span>' +
+        '</button><div class="submission-feedback"></div></div></div>';
+}
+
+function createDom(numCells) {
+    var window = new JSDOM(tableHtml(numCells)).window;
+    return {$: jquery(window), element: window.document.querySelector('.activetable_block')};
+}
+
+// The previous implementation of answer collection and cell marking, used as the baseline.
+function baselineCheck($, element, data) {
+    var answers = {};
+    $('td.active', element).each(function() {
+        answers[this.id] = $('input', this).val();
+    });
+    if (data.answers_correct) {
+        $.each(data.answers_correct, function(cell_id, correct) {
+            var $cell = $('#' + cell_id, element);
+            $cell.removeClass('right-answer wrong-answer unchecked');
+            if (correct) {
+                $cell.addClass('right-answer');
+                $cell.prop('title', 'correct');
+            } else {
+                $cell.addClass('wrong-answer');
+                $cell.prop('title', 'incorrect');
+            }
+        });
+    } else {
+        $('td.active', element).removeClass('right-answer wrong-answer').addClass('unchecked');
+    }
+    return answers;
+}
+
+function status(cellIds, isCorrect) {
+    var answersCorrect = {}, numCorrect = 0;
+    cellIds.forEach(function(cellId, i) {
+        answersCorrect[cellId] = isCorrect(i);
+        numCorrect += answersCorrect[cellId] ? 1 : 0;
+    });
+    return {
+        answers_correct: answersCorrect,
+        num_correct_answers: numCorrect,
+        num_total_answers: cellIds.length,
+        score: numCorrect / cellIds.length,
+        maximum_score: 1.0,
+        attempts: 1,
+        max_attempts: null
+    };
+}
+
+function median(values) {
+    var sorted = values.slice().sort(function(a, b) { return a - b; });
+    return sorted[Math.floor(sorted.length / 2)];
+}
+
+function now() {
+    var time = process.hrtime();
+    return time[0] * 1e3 + time[1] / 1e6;
+}
+
+function timeRuns(responses, iterations, check) {
+    var timings = [], start, i;
+    for (i = 0; i < iterations; i++) {
+        start = now();
+        check(responses[i % responses.length]);
+        timings.push(now() - start);
+    }
+    return median(timings);
+}
+
+function run(numCells, iterations) {
+    var unchecked = {answers_correct: null, score: null, maximum_score: 1.0, attempts: 0};
+    var runtime = {handlerUrl: function(element, handler) { return '/handler/' + handler; }};
+    var source = fs.readFileSync(SOURCE_PATH, 'utf8');
+    var slower = false;
+
+    var current = createDom(numCells);
+    var cellIds = current.$('td.active', current.element).map(function() {
+        return this.id;
+    }).get();
+    var scenarios = {
+        'all cells change': [status(cellIds, function() { return true; }),
+                             status(cellIds, function() { return false; })],
+        '10% of cells change': [status(cellIds, function(i) { return i % 10 !== 0; }),
+                                status(cellIds, function() { return true; })],
+        'no cell changes': [status(cellIds, function() { return true; })]
+    };
+
+    // The handler responds synchronously, so a click measures answer collection and status update.
+    var response;
+    current.$.ajax = function(options) { options.success(response); };
+    var ActiveTableXBlock = new Function('$', source + '\nreturn ActiveTableXBlock;')(current.$);
+    var start = now();
+    ActiveTableXBlock(runtime, current.element, unchecked);
+    console.log('init (' + numCells + ' cells): ' + (now() - start).toFixed(2) + ' ms');
+
+    var baseline = createDom(numCells);
+    baselineCheck(baseline.$, baseline.element, unchecked);
+
+    Object.keys(scenarios).forEach(function(name) {
+        var currentTime = timeRuns(scenarios[name], iterations, function(data) {
+            response = data;
+            current.$('.action .check', current.element).click();
+        });
+        var baselineTime = timeRuns(scenarios[name], iterations, function(data) {
+            baselineCheck(baseline.$, baseline.element, data);
+        });
+        console.log('check, ' + name + ': median ' + currentTime.toFixed(2) + ' ms, baseline ' +
+                    baselineTime.toFixed(2) + ' ms (' +
+                    (baselineTime / currentTime).toFixed(1) + 'x)');
+        slower = slower || currentTime > baselineTime;
+    });
+    if (slower) {
+        console.log('FAIL: the current code is slower than the baseline.');
+        process.exitCode = 1;
+    }
+}
+
+run(parseInt(process.argv[2], 10) || 1000, parseInt(process.argv[3], 10) || 50);
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Load test for the ActiveTableXBlock with many simulated learners.
+
+Each simulated learner gets its own block instance backed by in-memory field data and repeatedly
+renders the student view, saves answers and checks answers through the XBlock runtime.  Learners
+run concurrently in a thread pool or a process pool.  The latencies of all requests are collected
+and reported as percentiles together with the overall throughput.  No external services are needed.
+
+Usage:
+
+    python -m tests.load.loadtest --learners 200 --rounds 5 --sizes 10,100,1000 --pool thread
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import argparse
+import json
+import random
+import time
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
+
+from webob import Request
+from xblock.field_data import DictFieldData
+from xblock.fields import ScopeIds
+
+from activetable.activetable import ActiveTableXBlock
+from activetable.export import StaticExportRuntime, configure_django
+
+OPERATIONS = ['student_view', 'save_answers', 'check_answers']
+
+
+def make_table_definition(num_rows):
+    """Return a synthetic table definition with two response cells in each row."""
+    rows = ["['Row', 'Numeric', 'Text']"]
+    for i in range(1, num_rows + 1):
+        rows.append("['Row {0}', Numeric(answer={0}), Text(answer='answer {0}')]".format(i))
+    return '[\n' + ',\n'.join(rows) + '\n]'
+
+
+def make_answers(num_rows, rng):
+    """Return a random mix of correct and incorrect answers for a synthetic table."""
+    answers = {}
+    for i in range(1, num_rows + 1):
+        correct = rng.random() < 0.5
+        answers['cell_{}_1'.format(i)] = str(i) if correct else 'wrong'
+        answers['cell_{}_2'.format(i)] = 'answer {}'.format(i) if correct else 'wrong'
+    return answers
+
+
+def json_request(data):
+    """Build a POST request with a JSON body, as sent by the frontend code."""
+    request = Request.blank('/', method='POST')
+    request.body = json.dumps(data).encode('utf-8')
+    return request
+
+
+def run_learner(args):
+    """Simulate a single learner and return a list of (operation, latency in seconds) tuples.
+
+    This is a module-level function so it can be used with a process pool.
+    """
+    learner_id, table_definition, num_rows, rounds = args
+    rng = random.Random(learner_id)
+    runtime = StaticExportRuntime()
+    scope_ids = ScopeIds('learner-{}'.format(learner_id), 'activetable', 'definition', 'usage')
+    block = ActiveTableXBlock(runtime, DictFieldData(dict(content=table_definition)), scope_ids)
+    timings = []
+    for _ in range(rounds):
+        for operation in OPERATIONS:
+            start = time.time()
+            if operation == 'student_view':
+                runtime.render(block, 'student_view')
+            else:
+                request = json_request(make_answers(num_rows, rng))
+                response = runtime.handle(block, operation, request)
+                assert response.status_int == 200, response.body
+            timings.append((operation, time.time() - start))
+    return timings
+
+
+def percentile(sorted_values, fraction):
+    """Return the given percentile of a sorted list using the nearest-rank method."""
+    index = max(int(round(fraction * len(sorted_values))) - 1, 0)
+    return sorted_values[index]
+
+
+def run_load_test(num_rows, learners, rounds, pool_type, workers):
+    """Run all learners for one table size and return a dictionary with the results."""
+    table_definition = make_table_definition(num_rows)
+    pool = (ThreadPool if pool_type == 'thread' else Pool)(workers)
+    jobs = [(learner_id, table_definition, num_rows, rounds) for learner_id in range(learners)]
+    start = time.time()
+    try:
+        results = pool.map(run_learner, jobs)
+    finally:
+        pool.close()
+        pool.join()
+    wall_time = time.time() - start
+    latencies = {operation: [] for operation in OPERATIONS}
+    for timings in results:
+        for operation, latency in timings:
+            latencies[operation].append(latency)
+    report = dict(
+        rows=num_rows,
+        pool=pool_type,
+        requests=sum(len(values) for values in latencies.values()),
+        wall_time=wall_time,
+        operations={},
+    )
+    report['throughput'] = report['requests'] / wall_time
+    for operation, values in latencies.items():
+        values.sort()
+        report['operations'][operation] = dict(
+            p50=percentile(values, 0.50),
+            p95=percentile(values, 0.95),
+            p99=percentile(values, 0.99),
+        )
+    return report
+
+
+def print_report(report):
+    """Print the results of run_load_test() as a table with latencies in milliseconds."""
+    print('{rows} rows, {pool} pool: {requests} requests in {wall_time:.2f} s, '
+          '{throughput:.1f} requests/s'.format(**report))
+    print('    {:<15}{:>10}{:>10}{:>10}'.format('operation', 'p50 [ms]', 'p95 [ms]', 'p99 [ms]'))
+    for operation in OPERATIONS:
+        stats = report['operations'][operation]
+        print('    {:<15}{:>10.1f}{:>10.1f}{:>10.1f}'.format(
+            operation, stats['p50'] * 1000, stats['p95'] * 1000, stats['p99'] * 1000
+        ))
+
+
+def main():
+    """Parse the command line arguments and run the load test for all table sizes."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--learners', type=int, default=100,
+                        help='number of simulated learners per table size')
+    parser.add_argument('--rounds', type=int, default=3,
+                        help='number of view/save/check rounds per learner')
+    parser.add_argument('--sizes', default='10,100,1000',
+                        help='comma-separated list of table sizes in rows')
+    parser.add_argument('--pool', choices=['thread', 'process', 'both'], default='both',
+                        help='type of worker pool used to run the learners')
+    parser.add_argument('--workers', type=int, default=8, help='number of pool workers')
+    args = parser.parse_args()
+    configure_django()
+    pool_types = ['thread', 'process'] if args.pool == 'both' else [args.pool]
+    for num_rows in [int(size) for size in args.sizes.split(',')]:
+        for pool_type in pool_types:
+            print_report(run_load_test(num_rows, args.learners, args.rounds, pool_type,
+                                       args.workers))
+
+
+if __name__ == '__main__':
+    main()
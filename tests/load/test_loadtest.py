@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, unicode_literals
+
+import unittest
+
+from tests.load import loadtest
+
+class LoadTestTest(unittest.TestCase):
+    """Smoke test for the load test harness with a small number of learners."""
+
+    def verify_report(self, pool_type):
+        report = loadtest.run_load_test(
+            num_rows=5, learners=4, rounds=2, pool_type=pool_type, workers=2
+        )
+        self.assertEqual(report['requests'], 4 * 2 * len(loadtest.OPERATIONS))
+        self.assertGreater(report['throughput'], 0)
+        for operation in loadtest.OPERATIONS:
+            stats = report['operations'][operation]
+            self.assertLessEqual(stats['p50'], stats['p95'])
+            self.assertLessEqual(stats['p95'], stats['p99'])
+
+    def test_thread_pool(self):
+        self.verify_report('thread')
+
+    def test_process_pool(self):
+        self.verify_report('process')
@@ -5,6 +5,7 @@ from __future__ import absolute_import, division, unicode_literals
 import unittest
 
 import mock
+from webob import Request
 from xblock.field_data import DictFieldData
 from xblock.runtime import Runtime
 from xblock.validation import Validation
@@ -42,3 +43,30 @@ class ActiveTableTest(unittest.TestCase):
         self.verify_validation(data, False)
         data.row_heights = '[1, 2]'
         self.verify_validation(data, True)
+
+    def verify_cache_control(self, response):
+        cache_control = [
+            directive.strip() for directive in response.headers['Cache-Control'].split(',')
+        ]
+        self.assertIn('private', cache_control)
+        self.assertIn('no-cache', cache_control)
+
+    def test_status_handler(self):
+        self.block.answers = dict(cell_1_1='1789')
+        response = self.block.status(Request.blank('/'))
+        self.assertEqual(response.status_int, 200)
+        self.assertEqual(response.json_body, self.block.get_status())
+        self.verify_cache_control(response)
+        tag = response.etag
+
+        request = Request.blank('/', headers={'If-None-Match': '"{}"'.format(tag)})
+        response = self.block.status(request)
+        self.assertEqual(response.status_int, 304)
+        self.assertEqual(response.body, b'')
+        self.assertEqual(response.etag, tag)
+        self.verify_cache_control(response)
+
+        self.block.answers_correct = dict(cell_1_1=True)
+        response = self.block.status(request)
+        self.assertEqual(response.status_int, 200)
+        self.assertNotEqual(response.etag, tag)
@@ -29,6 +29,23 @@ class CellTest(unittest.TestCase):
         self.assertFalse(cell.check_response('6.2'))
         self.assertFalse(cell.check_response('6.2382'))
 
+    def test_numeric_cell_with_unit(self):
+        cell = NumericCell(answer=9.81, tolerance=1.0, unit='m/s^2')
+        self.assertTrue(cell.check_response('9.81 m/s^2'))
+        self.assertTrue(cell.check_response('9.81m/s^2'))
+        self.assertTrue(cell.check_response('981 cm/s^2'))
+        self.assertTrue(cell.check_response('9.81 N/kg'))
+        self.assertTrue(cell.check_response('9.81'))
+        self.assertFalse(cell.check_response('9.81 m/s'))
+        self.assertFalse(cell.check_response('9.81 giraffes'))
+        self.assertFalse(cell.check_response('981 m/s^2'))
+        self.assertFalse(cell.check_response('m/s^2'))
+        self.assertFalse(cell.check_response('1 km^400'))
+        self.assertFalse(cell.check_response('1 ' + '(' * 2000 + 'm' + ')' * 2000))
+        cell = NumericCell(answer=100, tolerance=1.0, unit='km/h', max_significant_digits=3)
+        self.assertTrue(cell.check_response('27.8 m/s'))
+        self.assertFalse(cell.check_response('27.78 m/s'))
+
     def test_string_cell(self):
         cell = TextCell('OpenCraft')
         self.assertTrue(cell.check_response('OpenCraft'))
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, unicode_literals
+
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from activetable.export import DEFAULT_JQUERY_URL, export, find_definitions, script_json
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+TABLE = """
+[
+    ['Event', 'Year'],
+    ['French Revolution', Numeric(answer=1789)],
+]
+"""
+
+class ExportTest(unittest.TestCase):
+
+    def setUp(self):
+        self.olx_dir = tempfile.mkdtemp()
+        self.output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.olx_dir)
+        self.addCleanup(shutil.rmtree, self.output_dir)
+        os.mkdir(os.path.join(self.olx_dir, 'activetable'))
+        self.write_olx('activetable/first.xml', '<activetable>{}</activetable>'.format(TABLE))
+        self.write_olx('activetable/second.xml', '<activetable>{}</activetable>'.format(TABLE))
+        self.write_olx('activetable/third.xml',
+                       '<activetable max_attempts="2">{}</activetable>'.format(TABLE))
+        self.write_olx(
+            'vertical.xml',
+            '<vertical><activetable url_name="first"/>'
+            '<activetable url_name="inline">{}</activetable></vertical>'.format(TABLE)
+        )
+
+    def write_olx(self, path, data):
+        with io.open(os.path.join(self.olx_dir, path), 'w', encoding='utf-8') as out:
+            out.write(data)
+
+    def test_find_definitions(self):
+        url_names = [url_name for url_name, _, _ in find_definitions(self.olx_dir)]
+        self.assertEqual(url_names, ['inline', 'first', 'second', 'third'])
+
+    def test_export(self):
+        manifest, errors = export(self.olx_dir, self.output_dir, processes=2)
+        self.assertEqual(errors, {})
+        self.assertEqual(sorted(manifest), ['first', 'inline', 'second', 'third'])
+        self.assertEqual(manifest['first'], manifest['second'])
+        self.assertEqual(manifest['first'], manifest['inline'])
+        self.assertNotEqual(manifest['first']['page'], manifest['third']['page'])
+        self.assertEqual(manifest['third']['init_args']['max_attempts'], 2)
+        with io.open(os.path.join(self.output_dir, 'manifest.json'), encoding='utf-8') as inp:
+            self.assertEqual(json.load(inp), manifest)
+        self.assertEqual(len(os.listdir(os.path.join(self.output_dir, 'blocks'))), 2)
+        assets = os.listdir(os.path.join(self.output_dir, 'assets'))
+        self.assertEqual(sorted(os.path.splitext(name)[1] for name in assets), ['', '.css', '.js'])
+        self.assertIn('correct-icon.png',
+                      os.listdir(os.path.join(self.output_dir, 'assets', 'public', 'img')))
+        with io.open(os.path.join(self.output_dir, manifest['first']['page']),
+                     encoding='utf-8') as inp:
+            page = inp.read()
+        self.assertIn('French Revolution', page)
+        self.assertIn('cell_1_1', page)
+
+        # The page loads jQuery before the block's code and then initializes the block.
+        jquery_pos = page.index('<script src="{}"></script>'.format(DEFAULT_JQUERY_URL))
+        js_pos = page.index('<script src="../assets/')
+        init_call = 'window["ActiveTableXBlock"](runtime, element, {});'.format(
+            script_json(manifest['first']['init_args'])
+        )
+        self.assertLess(jquery_pos, js_pos)
+        self.assertLess(js_pos, page.index(init_call))
+
+    def test_export_with_broken_definition(self):
+        self.write_olx('activetable/broken.xml',
+                       '<activetable>[["Unit"], [Numeric(answer=9.81, unit=1)]]</activetable>')
+        manifest, errors = export(self.olx_dir, self.output_dir, processes=2)
+        self.assertEqual(sorted(manifest), ['first', 'inline', 'second', 'third'])
+        self.assertEqual(list(errors), ['broken'])
+        self.assertIn('ParseError', errors['broken'])
+        self.assertEqual(len(os.listdir(os.path.join(self.output_dir, 'blocks'))), 2)
+
+    def test_command_line(self):
+        # The command must work without any Django settings provided by the environment.
+        env = dict(os.environ)
+        env.pop('DJANGO_SETTINGS_MODULE', None)
+        self.write_olx('activetable/broken.xml',
+                       '<activetable>[["Unit"], [Numeric(answer=9.81, unit=1)]]</activetable>')
+        process = subprocess.Popen(
+            [sys.executable, '-m', 'activetable.export', '--processes', '2', self.olx_dir,
+             self.output_dir],
+            cwd=REPO_ROOT,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        _, stderr = process.communicate()
+        # The broken block is reported and makes the command fail, but the others are exported.
+        self.assertEqual(process.returncode, 1, stderr)
+        self.assertIn('broken: ', stderr)
+        self.assertIn('ParseError', stderr)
+        with io.open(os.path.join(self.output_dir, 'manifest.json'), encoding='utf-8') as inp:
+            self.assertEqual(sorted(json.load(inp)), ['first', 'inline', 'second', 'third'])
+
+    def test_export_removes_stale_files(self):
+        stale_page = os.path.join(self.output_dir, 'blocks', 'stale.html')
+        os.mkdir(os.path.dirname(stale_page))
+        with io.open(stale_page, 'w', encoding='utf-8') as out:
+            out.write('stale')
+        export(self.olx_dir, self.output_dir, processes=1)
+        self.assertFalse(os.path.exists(stale_page))
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""Import-time checks for the activetable package.
+
+Importing the package happens in every LMS worker, so it must stay cheap.  The modules only needed
+for parsing, rendering and grading must not be imported until they are used.
+
+The import time of the package, including everything it imports, is checked against a budget.  On
+Python 3.7 and newer, the cumulative time of the activetable package is taken from "python -X
+importtime"; on all interpreters, the best wall time of several imports in fresh interpreters is
+checked as well.  Since wall-clock timings are unreliable on loaded machines, the default budget is
+generous; set the environment variable ACTIVETABLE_IMPORT_TIME_BUDGET_MS to tighten it.
+"""
+from __future__ import absolute_import, division, unicode_literals
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+IMPORT_TIME_BUDGET_MS = float(os.environ.get('ACTIVETABLE_IMPORT_TIME_BUDGET_MS', 3000))
+
+# Number of fresh interpreters used to measure the wall time of the import.
+IMPORT_TIME_RUNS = 5
+
+DEFERRED_MODULES = ['activetable.cells', 'activetable.parsers', 'activetable.units']
+
+
+def loaded_modules(statement):
+    """Run the statement in a fresh interpreter and return the loaded activetable modules."""
+    output = subprocess.check_output(
+        [sys.executable, '-c', statement + '; import json, sys; print(json.dumps(sorted('
+         'm for m in sys.modules if m.split(".")[0] == "activetable")))'],
+        cwd=REPO_ROOT,
+        universal_newlines=True,
+    )
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def best_import_wall_time(statement, runs=IMPORT_TIME_RUNS):
+    """Return the best wall time in milliseconds of running the statement in fresh interpreters."""
+    times = []
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, '-c', 'import time; start = time.time(); ' + statement +
+             '; print((time.time() - start) * 1000)'],
+            cwd=REPO_ROOT,
+            universal_newlines=True,
+        )
+        times.append(float(output.strip().splitlines()[-1]))
+    return min(times)
+
+
+def measure_import_times(statement):
+    """Run the statement with "python -X importtime" and return the timings per module.
+
+    The result maps module names to tuples (self time, cumulative time) in microseconds.
+    """
+    process = subprocess.Popen(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=REPO_ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    _, stderr = process.communicate()
+    if process.returncode:
+        raise RuntimeError(stderr)
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        timings[name.strip()] = int(self_time), int(cumulative)
+    return timings
+
+
+class ImportTest(unittest.TestCase):
+
+    def test_deferred_modules(self):
+        modules = loaded_modules('import activetable')
+        self.assertIn('activetable.activetable', modules)
+        for module in DEFERRED_MODULES:
+            self.assertNotIn(module, modules)
+        # The profiling code is only imported when a block is rendered or graded.
+        self.assertNotIn('activetable.profiling', modules)
+
+    def test_deferred_modules_loaded_on_use(self):
+        modules = loaded_modules('import activetable; from activetable.parsers import parse_table')
+        for module in DEFERRED_MODULES:
+            self.assertIn(module, modules)
+
+    def test_import_wall_time(self):
+        self.assertLess(best_import_wall_time('import activetable'), IMPORT_TIME_BUDGET_MS)
+
+    @unittest.skipUnless(sys.version_info >= (3, 7), 'python -X importtime requires Python 3.7')
+    def test_cumulative_import_time(self):
+        # The cumulative time of the top-level package includes everything imported by it.
+        _, cumulative = measure_import_times('import activetable')['activetable']
+        self.assertLess(cumulative, IMPORT_TIME_BUDGET_MS * 1000)
@@ -16,6 +16,7 @@ class ParserTest(unittest.TestCase):
             ['Event', 'Year'],
             ['French Revolution', Numeric(answer=1789)],
             ['Volcano exploded in 1883', Text(answer='Krakatoa')],
+            ['Gravitational acceleration', Numeric(answer=9.81, unit='m/s^2')],
             [6.283, 123],
         ]
         """
@@ -33,6 +34,13 @@ class ParserTest(unittest.TestCase):
         self.assertEqual(thead, expected[0])
         self.assertEqual(tbody, expected_body)
 
+    def test_parse_table_non_ascii_unit(self):
+        _, tbody = parse_table("[['Resistance'], [Numeric(answer=1, unit='kΩ')]]")
+        cell = tbody[0]['cells'][0]
+        self.assertEqual(cell.unit, 'kΩ')
+        self.assertEqual(cell.unit_factor, 1000.0)
+        self.assertTrue(cell.check_response('1000 Ω'))
+
     @ddt.data(
         'syntax error',
         '"wrong type"',
@@ -45,6 +53,8 @@ class ParserTest(unittest.TestCase):
         '[["header", "header"], ["wrong argument class", Numeric(3)]]',
         '[["header", "header"], ["wrong argument name", Numeric(giraffe=3)]]',
         '[["header", "header"], ["wrong argument value", Numeric(giraffe="3")]]',
+        '[["header", "header"], ["wrong unit type", Numeric(answer=3, unit=1)]]',
+        '[["header", "header"], ["unknown unit", Numeric(answer=3, unit="giraffe")]]',
     )
     def test_parse_table_errors(self, table_definition):
         with self.assertRaises(ParseError):
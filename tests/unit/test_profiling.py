@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, unicode_literals
+
+import gc
+import os
+import random
+import subprocess
+import sys
+import threading
+import unittest
+
+import mock
+from xblock.field_data import DictFieldData
+from xblock.runtime import Runtime
+
+from activetable.activetable import ActiveTableXBlock
+from activetable.profiling import MemoryProfile, tracemalloc
+from tests.load.loadtest import json_request, make_answers, make_table_definition
+
+try:
+    import resource
+except ImportError:
+    resource = None  # pylint: disable=invalid-name
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+MB = 1024 * 1024
+
+# Upper bounds for the peak memory of each phase for the 1000-row reference table.
+PEAK_MEMORY_BOUNDS = {
+    'parse': 32 * MB,
+    'postprocess': 8 * MB,
+    'render': 32 * MB,
+    'grade': 8 * MB,
+}
+
+# Upper bound for the growth of the peak resident set size while rendering and grading the
+# reference table.
+PEAK_RSS_BOUND = 64 * MB
+
+
+def make_reference_block():
+    return ActiveTableXBlock(
+        mock.Mock(spec=Runtime),
+        DictFieldData(dict(content=make_table_definition(1000))),
+        mock.Mock(),
+    )
+
+
+def reference_answers():
+    return make_answers(1000, random.Random(0))
+
+
+def max_rss():
+    """Return the peak resident set size of this process in bytes."""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def peak_rss_growth():
+    """Render and grade the reference table and return the growth of the peak RSS in bytes.
+
+    This is meant to be run in a fresh interpreter, see test_reference_table_rss.
+    """
+    if os.environ.get('DJANGO_SETTINGS_MODULE'):
+        import django
+        django.setup()
+    import activetable.parsers  # pylint: disable=unused-import
+    block = make_reference_block()
+    answers = reference_answers()
+    gc.collect()
+    before = max_rss()
+    block.student_view()
+    block.grade_answers(answers)
+    return max_rss() - before
+
+
+class MemoryProfileTest(unittest.TestCase):
+
+    def test_disabled(self):
+        profile = MemoryProfile('test')
+        with mock.patch('activetable.profiling.ENABLED', False):
+            with profile.phase('phase'):
+                [0] * 1000
+        self.assertEqual(profile.as_dict(), dict(label='test', phases=[]))
+
+    @unittest.skipIf(resource is None, 'measuring the peak RSS requires the resource module')
+    def test_reference_table_rss(self):
+        output = subprocess.check_output(
+            [sys.executable, '-c',
+             'from tests.unit.test_profiling import peak_rss_growth; print(peak_rss_growth())'],
+            cwd=REPO_ROOT,
+            universal_newlines=True,
+        )
+        self.assertLess(int(output.strip().splitlines()[-1]), PEAK_RSS_BOUND)
+
+    @unittest.skipIf(tracemalloc is None, 'memory profiling requires tracemalloc')
+    @mock.patch('activetable.profiling.ENABLED', True)
+    def test_reference_table_bounds(self):
+        block = make_reference_block()
+        _, render_profile = block.profiled_student_view()
+        _, grade_profile = block.profiled_grade_answers(reference_answers())
+        phases = render_profile.phases + grade_profile.phases
+        self.assertEqual(
+            [phase['name'] for phase in phases],
+            ['parse', 'postprocess', 'render', 'parse', 'postprocess', 'grade'],
+        )
+        for phase in phases:
+            self.assertFalse(phase['concurrent'])
+            if phase['peak'] is not None:
+                self.assertLess(phase['peak'], PEAK_MEMORY_BOUNDS[phase['name']], phase)
+            self.assertLess(phase['allocated'], PEAK_MEMORY_BOUNDS[phase['name']], phase)
+            self.assertTrue(phase['top'])
+
+    @unittest.skipIf(tracemalloc is None, 'memory profiling requires tracemalloc')
+    @mock.patch('activetable.profiling.ENABLED', True)
+    def test_memory_profile_handler(self):
+        block = make_reference_block()
+        response = block.memory_profile(json_request(reference_answers()))
+        self.assertEqual(response.status_int, 200)
+        self.assertEqual(
+            [profile['label'] for profile in response.json_body], ['student_view', 'grade_answers']
+        )
+        response = block.memory_profile(json_request(dict(cell_0_0='1')))
+        self.assertEqual(response.status_int, 400)
+        self.assertIn('cell_0_0', response.json_body['error'])
+        response = block.memory_profile(json_request(['1']))
+        self.assertEqual(response.status_int, 400)
+
+    @mock.patch('activetable.profiling.ENABLED', False)
+    def test_memory_profile_handler_disabled(self):
+        response = make_reference_block().memory_profile(json_request({}))
+        self.assertEqual(response.status_int, 404)
+
+    @unittest.skipIf(tracemalloc is None, 'memory profiling requires tracemalloc')
+    @mock.patch('activetable.profiling.ENABLED', True)
+    def test_concurrent_phases(self):
+        first_started = threading.Event()
+        second_finished = threading.Event()
+        profiles = [MemoryProfile('first'), MemoryProfile('second')]
+        errors = []
+
+        def first():
+            try:
+                with profiles[0].phase('phase'):
+                    first_started.set()
+                    second_finished.wait(5)
+            except Exception as exc:  # pylint: disable=broad-except
+                errors.append(exc)
+
+        thread = threading.Thread(target=first)
+        thread.start()
+        first_started.wait(5)
+        with profiles[1].phase('phase'):
+            [0] * 1000
+        second_finished.set()
+        thread.join()
+        self.assertEqual(errors, [])
+        for profile in profiles:
+            self.assertEqual(len(profile.phases), 1)
+            self.assertTrue(profile.phases[0]['concurrent'])
+            self.assertIsNone(profile.phases[0]['peak'])
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, unicode_literals
+
+import ddt
+import mock
+import unittest
+
+from activetable import units
+from activetable.units import UnitError, parse_unit
+
+@ddt.ddt
+class UnitTest(unittest.TestCase):
+
+    def assertUnitEqual(self, unit1, unit2):
+        factor1, dimensions1 = parse_unit(unit1)
+        factor2, dimensions2 = parse_unit(unit2)
+        self.assertAlmostEqual(factor1, factor2)
+        self.assertEqual(dimensions1, dimensions2)
+
+    def test_parse_unit(self):
+        self.assertEqual(parse_unit('m'), (1.0, (1, 0, 0, 0, 0, 0, 0)))
+        self.assertEqual(parse_unit('kg'), (1.0, (0, 1, 0, 0, 0, 0, 0)))
+        self.assertEqual(parse_unit(''), (1.0, (0, 0, 0, 0, 0, 0, 0)))
+        self.assertUnitEqual('N', 'kg*m/s^2')
+        self.assertUnitEqual('J', 'N m')
+        self.assertUnitEqual('J/(mol*K)', 'J mol^-1 K^-1')
+        self.assertUnitEqual('m/s^2', 'm·s**-2')
+        self.assertUnitEqual('kΩ', 'kohm')
+        self.assertUnitEqual('µs', 'us')
+        self.assertAlmostEqual(parse_unit('cm/s^2')[0], 0.01)
+        self.assertAlmostEqual(parse_unit('km/h')[0], 1 / 3.6)
+        self.assertAlmostEqual(parse_unit('mmol')[0], 1e-3)
+        self.assertAlmostEqual(parse_unit('min')[0], 60.0)
+
+    def test_memoization(self):
+        self.assertIs(parse_unit('kg*m^2/s^2'), parse_unit('kg*m^2/s^2'))
+
+    def test_cache_eviction(self):
+        with mock.patch.object(units, '_UNIT_CACHE_SIZE', 2):
+            units._unit_cache.clear()
+            parse_unit('m')
+            parse_unit('s')
+            parse_unit('m')
+            parse_unit('kg')
+            self.assertEqual(list(units._unit_cache), ['m', 'kg'])
+            with self.assertRaises(UnitError):
+                parse_unit('giraffe')
+            self.assertEqual(list(units._unit_cache), ['m', 'kg'])
+
+    @ddt.data(
+        'giraffe', 'm/', '(m', 'm)', '^2', 'm^x', 'm + s', '2 m', 'kmin',
+        'km^400', 'km^-400', '(km^99)^99', 'm/(fm^99)^99', '(' * 2000 + 'm' + ')' * 2000,
+        '(' * 11 + 'm' + ')' * 11, 'm' * 101,
+    )
+    def test_parse_unit_errors(self, unit):
+        with self.assertRaises(UnitError):
+            parse_unit(unit)